@@ -2,6 +2,8 @@
 # dependencies = [
 #   "streamlit",
 #   "polars",
+#   "numpy",
+#   "matplotlib",
 # ]
 # ///
 
@@ -12,8 +14,12 @@ Displays top overperforming and underperforming FPL players based on xFPL calcul
 Split by regular starters vs rotation/bench players.
 """
 
+import numpy as np
 import streamlit as st
 import polars as pl
+from matplotlib import colormaps
+from matplotlib.colors import to_hex
+
 from fpl_data_fetcher import fetch_fpl_data
 from xfpl_calculator import XFPLCalculator
 
@@ -24,82 +30,16 @@ st.set_page_config(page_title="FPL Performance Analyzer", page_icon="⚽", layou
 # Minutes threshold to distinguish regular players from rotation/bench
 REGULAR_PLAYER_MINUTES = 900  # ~10 full matches (900 minutes)
 
+# Colormaps sampled once at import into 256-entry hex LUTs, so table renders
+# never go through matplotlib's per-cell colormap evaluation (pandas Styler's
+# background_gradient is the slowest part of each rerun)
+COLOR_LUTS = {
+    name: np.array([to_hex(colormaps[name](i / 255)) for i in range(256)])
+    for name in ("Greens", "Reds_r")
+}
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def load_and_calculate_data():
-    """Load FPL data and calculate xFPL."""
-    players_df = fetch_fpl_data()
-    calculator = XFPLCalculator(players_df)
-    results_df = calculator.calculate_xfpl()
-    return results_df, calculator
-
-
-def display_performance_table(df, title, caption, color_map, is_overperformer=True):
-    """Display a styled performance table."""
-    st.subheader(title)
-    st.caption(caption)
-
-    # Prepare display dataframe - convert to pandas for streamlit
-    display_df = df.select(
-        [
-            "name",
-            "team",
-            "position",
-            "minutes",
-            "total_points",
-            "xFPL",
-            "delta",
-            "performance_pct",
-        ]
-    ).to_pandas()
-
-    display_df.columns = [
-        "Player",
-        "Team",
-        "Pos",
-        "Mins",
-        "Actual",
-        "xFPL",
-        "Delta",
-        "Perf %",
-    ]
-    display_df.insert(0, "Rank", range(1, len(display_df) + 1))
-
-    # Style the dataframe
-    if is_overperformer:
-        styled_df = display_df.style.background_gradient(
-            subset=["Delta"], cmap=color_map, vmin=0
-        )
-    else:
-        styled_df = display_df.style.background_gradient(
-            subset=["Delta"], cmap=color_map, vmax=0
-        )
-
-    styled_df = styled_df.format(
-        {
-            "Mins": "{:.0f}",
-            "Actual": "{:.0f}",
-            "xFPL": "{:.1f}",
-            "Delta": "{:+.1f}",
-            "Perf %": "{:.0f}%",
-        }
-    )
-
-    st.dataframe(styled_df, hide_index=True, width="stretch", height=400)
-
-
-def main():
-    st.title("⚽ FPL Over/Underperformance Analyzer")
-    st.markdown("""
-    Compare players' **Actual FPL Points** to their **Expected FPL Points (xFPL)**
-    to identify who's overperforming (lucky) vs. underperforming (unlucky).
 
-    **Split by playing time:** Regular starters (≥900 mins) vs Rotation/Bench players (<900 mins)
-    """)
-
-    # Strategy Guide - Always visible
-    with st.expander("📖 **How to Use This Tool for FPL Transfers**", expanded=False):
-        st.markdown("""
+_STRATEGY_MD = """
         ### Understanding the Metrics
 
         **xFPL** = Expected FPL Points based on underlying stats (xG, xA, xCS, BPS)
@@ -177,132 +117,218 @@ def main():
         - ✅ BPS-based bonus estimation (not circular logic)
         - ✅ Per-90 metrics for fair comparison
         - ✅ Percentile-based recommendations (adapts to player pool)
-        """)
+        """
 
-    st.markdown("---")
+_METHODOLOGY_MD = """
+        **Expected FPL Points (xFPL)** uses an improved industry-standard algorithm:
 
-    # Load data
-    with st.spinner("Loading FPL data..."):
-        try:
-            results_df, calculator = load_and_calculate_data()
-        except Exception as e:
-            st.error(f"Error loading data: {e}")
-            return
+        ### Core Components
 
-    # Summary statistics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total Players", len(results_df))
-    with col2:
-        avg_delta = results_df["delta"].mean()
-        st.metric("Avg Over/Under", f"{avg_delta:+.2f}")
-    with col3:
-        max_over = results_df["delta"].max()
-        st.metric("Max Overperformance", f"+{max_over:.1f}")
-    with col4:
-        max_under = results_df["delta"].min()
-        st.metric("Max Underperformance", f"{max_under:.1f}")
+        1. **Expected Goals Points**: `xG × position_multiplier`
+           - Goalkeepers: **10 points** per goal
+           - Defenders: **6 points** per goal
+           - Midfielders: **5 points** per goal
+           - Forwards: **4 points** per goal
 
-    st.markdown("---")
+        2. **Expected Assists Points**: `xA × 3`
 
-    # Split data by minutes
-    regular_players = results_df.filter(pl.col("minutes") >= REGULAR_PLAYER_MINUTES)
-    rotation_players = results_df.filter(pl.col("minutes") < REGULAR_PLAYER_MINUTES)
+        3. **Expected Clean Sheet Points**
+           - **Per-match probability**: `e^(-xGC_per_match)` (not cumulative!)
+           - Matches played = minutes ÷ 90
+           - Expected clean sheets = CS probability × matches played
+           - Goalkeepers/Defenders: 4 points per clean sheet
+           - Midfielders: 1 point per clean sheet
+           - Forwards: 0 points
 
-    # Filter by delta sign (all overperformers with +delta, all underperformers with -delta)
-    regular_over = regular_players.filter(pl.col("delta") >= 0).sort(
-        "delta", descending=True
-    )
-    regular_under = regular_players.filter(pl.col("delta") <= 0).sort(
-        "delta", descending=False
-    )
-    rotation_over = rotation_players.filter(pl.col("delta") >= 0).sort(
-        "delta", descending=True
-    )
-    rotation_under = rotation_players.filter(pl.col("delta") <= 0).sort(
-        "delta", descending=False
-    )
+        4. **Expected Bonus Points** ⭐
+           - **Estimated from BPS** (not actual bonus - no circular logic!)
+           - BPS per match = total BPS ÷ matches played
+           - Expected bonus ≈ (BPS per match ÷ 100) × 0.035 × matches
+           - ~3.5 bonus points per 100 BPS per match (empirical rate)
 
-    # Tabs for different views
-    tab1, tab2 = st.tabs(
-        ["🏃 Regular Starters (≥900 mins)", "🪑 Rotation/Bench (<900 mins)"]
-    )
+        5. **Expected Appearance Points**:
+           - 2 points for playing ≥60 minutes (from starts)
+           - 1 point for playing <60 minutes (from substitute minutes)
 
-    with tab1:
-        st.info(f"**{len(regular_players)} players** with ≥900 minutes played")
+        ### New Metrics ⭐
 
-        col_left, col_right = st.columns(2)
+        - **xFPL90** = (xFPL ÷ minutes) × 90 → Fair comparison regardless of playing time
+        - **xGI** = xG + xA → Total attacking threat
+        - **xGI90** = (xGI ÷ minutes) × 90 → Attacking threat per 90 minutes
 
-        with col_left:
-            display_performance_table(
-                regular_over,
-                f"🔥 Overperformers (Delta ≥ 0) - {len(regular_over)} Players",
-                "Regular players scoring MORE than expected (potentially unsustainable)",
-                "Greens",
-                is_overperformer=True,
-            )
+        ### Performance Metrics
 
-        with col_right:
-            display_performance_table(
-                regular_under,
-                f"❄️ Underperformers (Delta ≤ 0) - {len(regular_under)} Players",
-                "Regular players scoring LESS than expected (due for correction)",
-                "Reds_r",
-                is_overperformer=False,
-            )
+        **Delta** = Actual Points - xFPL
 
-    with tab2:
-        st.info(f"**{len(rotation_players)} players** with <900 minutes played")
+        - **Positive Delta**: Overperforming (could be skill or luck - check xFPL90!)
+        - **Negative Delta**: Underperforming (likely due for improvement)
 
-        col_left, col_right = st.columns(2)
+        **Performance %** = (Actual ÷ xFPL) × 100
 
-        with col_left:
-            display_performance_table(
-                rotation_over,
-                f"🔥 Overperformers (Delta ≥ 0) - {len(rotation_over)} Players",
-                "Rotation players scoring MORE than expected (small sample size)",
-                "Greens",
-                is_overperformer=True,
-            )
+        ### Data Source
 
-        with col_right:
-            display_performance_table(
-                rotation_under,
-                f"❄️ Underperformers (Delta ≤ 0) - {len(rotation_under)} Players",
-                "Rotation players scoring LESS than expected (small sample size)",
-                "Reds_r",
-                is_overperformer=False,
-            )
+        [Official FPL API](https://fantasy.premierleague.com/api/bootstrap-static/) - Updated live
+        """
 
-    st.markdown("---")
 
-    # Transfer Recommendations Section
-    st.header("💰 Transfer Recommendations")
-    st.markdown("""
-    Based on xFPL analysis, here are the **best buy targets** (underperformers with high xFPL)
-    and **sell candidates** (overperformers likely to regress).
-    """)
+@st.fragment
+def render_strategy_expander():
+    """Render the static strategy guide; fragment so reruns skip it."""
+    with st.expander("📖 **How to Use This Tool for FPL Transfers**", expanded=False):
+        st.markdown(_STRATEGY_MD)
+
+
+@st.fragment
+def render_methodology_expander():
+    """Render the static methodology notes; fragment so reruns skip it."""
+    with st.expander("📊 How is xFPL Calculated?"):
+        st.markdown(_METHODOLOGY_MD)
+
+
+def delta_background_css(delta: pl.Series, color_map, vmin=None, vmax=None):
+    """Map a delta column to per-cell background-color CSS via the hex LUT."""
+    lut = COLOR_LUTS[color_map]
+    lo = delta.min() if vmin is None else vmin
+    hi = delta.max() if vmax is None else vmax
+    if lo is None or hi is None or hi <= lo:
+        return [""] * len(delta)
+    idx = ((delta - lo) / (hi - lo) * 255).clip(0, 255).cast(pl.UInt8)
+    return [f"background-color: {c}" for c in lut[idx.to_numpy()]]
+
+
+@st.cache_data(ttl=3600)  # Cache for 1 hour
+def load_raw_data() -> pl.DataFrame:
+    """Load raw FPL player data."""
+    return fetch_fpl_data()
+
+
+@st.cache_data(ttl=3600)
+def compute_xfpl(df_hash: int, _players_df: pl.DataFrame) -> pl.DataFrame:
+    """Calculate xFPL, keyed on a cheap vectorized row hash of the input.
+
+    The leading-underscore arg is excluded from Streamlit's hashing (pickling
+    a whole DataFrame per lookup); df_hash stands in for it instead.
+    """
+    return XFPLCalculator(_players_df).calculate_xfpl()
+
+
+def load_and_calculate_data() -> pl.DataFrame:
+    """Load FPL data and calculate xFPL, each behind its own cache."""
+    players_df = load_raw_data()
+    return compute_xfpl(players_df.hash_rows().sum(), players_df)
+
+
+@st.fragment
+def display_performance_tables(
+    over_df, under_df, over_title, over_caption, under_title, under_caption
+):
+    """Display a tab's over- and underperformer tables as one combined frame.
+
+    Stacking both halves behind a Side column means one Arrow serialization
+    and one Styler pass per tab instead of two.
+    """
+    head_left, head_right = st.columns(2)
+    with head_left:
+        st.subheader(over_title)
+        st.caption(over_caption)
+    with head_right:
+        st.subheader(under_title)
+        st.caption(under_caption)
+
+    columns = [
+        "name",
+        "team",
+        "position",
+        "minutes",
+        "total_points",
+        "xFPL",
+        "delta",
+        "performance_pct",
+    ]
+    combined = pl.concat(
+        [
+            over_df.select(columns)
+            .with_row_index("Rank", offset=1)
+            .with_columns(pl.lit("🔥 Over").alias("Side")),
+            under_df.select(columns)
+            .with_row_index("Rank", offset=1)
+            .with_columns(pl.lit("❄️ Under").alias("Side")),
+        ]
+    )
 
+    # Delta backgrounds come from the precomputed LUT; number formatting is
+    # handled natively by column_config instead of a pandas Styler format pass
+    delta_css = delta_background_css(
+        over_df["delta"], "Greens", vmin=0
+    ) + delta_background_css(under_df["delta"], "Reds_r", vmax=0)
+
+    display_df = combined.select(["Rank", "Side", *columns]).to_pandas(
+        use_pyarrow_extension_array=True
+    )
+    display_df.columns = [
+        "Rank",
+        "Side",
+        "Player",
+        "Team",
+        "Pos",
+        "Mins",
+        "Actual",
+        "xFPL",
+        "Delta",
+        "Perf %",
+    ]
+
+    styled_df = display_df.style.apply(lambda _: delta_css, subset=["Delta"])
+
+    st.dataframe(
+        styled_df,
+        hide_index=True,
+        width="stretch",
+        height=400,
+        column_config={
+            "Mins": st.column_config.NumberColumn(format="%.0f"),
+            "Actual": st.column_config.NumberColumn(format="%.0f"),
+            "xFPL": st.column_config.NumberColumn(format="%.1f"),
+            "Delta": st.column_config.NumberColumn(format="%+.1f"),
+            "Perf %": st.column_config.NumberColumn(format="%.0f%%"),
+        },
+    )
+
+
+@st.fragment
+def render_recommendations(regular_players):
+    """Build and render the buy/sell recommendation tables.
+
+    A fragment, so widget interactions elsewhere on the page do not
+    re-collect the plans or re-serialize these tables.
+    """
     # IMPROVED Transfer Recommendations (Percentile-Based + Per-90 Metrics)
 
-    # Calculate percentiles for xFPL90 (quality per 90 minutes)
-    xfpl90_75th = regular_players.select(pl.col("xFPL90").quantile(0.75)).item()
+    # Calculate percentiles for xFPL90 (quality per 90 minutes); nearest
+    # interpolation is enough for a filter threshold and skips the lerp step
+    xfpl90_75th = regular_players.select(
+        pl.col("xFPL90").quantile(0.75, interpolation="nearest")
+    ).item()
+
+    # Both recommendation lists are built from the same lazy scan of
+    # regular_players so Polars can share it when collecting the two plans
+    recommendations_lf = regular_players.lazy()
 
     # BUY TARGETS: High-quality players (top 25% xFPL90) who are underperforming
-    buy_targets = (
-        regular_players.filter(
+    # (regular_players already enforces the minutes threshold)
+    buy_plan = (
+        recommendations_lf.filter(
             (pl.col("xFPL90") > xfpl90_75th)  # Top 25% underlying stats per 90
             & (pl.col("total_points") > 45)  # Has proven quality
             & (pl.col("delta") < -8)  # Underperforming
-            & (pl.col("minutes") > 900)  # Regular starter
         )
         .sort(["delta", "xFPL90"], descending=[False, True])
         .head(20)
     )
 
     # SELL CANDIDATES: Weak xFPL90 players who are overperforming
-    sell_candidates = (
-        regular_players.filter(
+    sell_plan = (
+        recommendations_lf.filter(
             (pl.col("xFPL90") < 4.0)  # Weak stats (<4 pts/90)
             & (pl.col("total_points") > 35)  # Has value
             & (pl.col("delta") > 12)  # Significantly overperforming
@@ -312,6 +338,8 @@ def main():
         .head(20)
     )
 
+    buy_targets, sell_candidates = pl.collect_all([buy_plan, sell_plan])
+
     rec_col1, rec_col2 = st.columns(2)
 
     with rec_col1:
@@ -321,20 +349,25 @@ def main():
         )
 
         if len(buy_targets) > 0:
-            buy_display = buy_targets.select(
-                [
-                    "name",
-                    "team",
-                    "position",
-                    "minutes",
-                    "total_points",
-                    "xFPL",
-                    "xFPL90",
-                    "delta",
-                ]
-            ).to_pandas()
+            buy_display = (
+                buy_targets.select(
+                    [
+                        "name",
+                        "team",
+                        "position",
+                        "minutes",
+                        "total_points",
+                        "xFPL",
+                        "xFPL90",
+                        "delta",
+                    ]
+                )
+                .with_row_index("Rank", offset=1)
+                .to_pandas(use_pyarrow_extension_array=True)
+            )
 
             buy_display.columns = [
+                "Rank",
                 "Player",
                 "Team",
                 "Pos",
@@ -344,23 +377,24 @@ def main():
                 "xFPL90",
                 "Delta",
             ]
-            buy_display.insert(0, "Rank", range(1, len(buy_display) + 1))
 
             st.dataframe(
-                buy_display.style.background_gradient(
-                    subset=["Delta"], cmap="Reds_r", vmax=0
-                ).format(
-                    {
-                        "Mins": "{:.0f}",
-                        "Actual": "{:.0f}",
-                        "xFPL": "{:.1f}",
-                        "xFPL90": "{:.2f}",
-                        "Delta": "{:+.1f}",
-                    }
+                buy_display.style.apply(
+                    lambda _: delta_background_css(
+                        buy_targets["delta"], "Reds_r", vmax=0
+                    ),
+                    subset=["Delta"],
                 ),
                 hide_index=True,
                 width="stretch",
                 height=400,
+                column_config={
+                    "Mins": st.column_config.NumberColumn(format="%.0f"),
+                    "Actual": st.column_config.NumberColumn(format="%.0f"),
+                    "xFPL": st.column_config.NumberColumn(format="%.1f"),
+                    "xFPL90": st.column_config.NumberColumn(format="%.2f"),
+                    "Delta": st.column_config.NumberColumn(format="%+.1f"),
+                },
             )
         else:
             st.info("No strong buy targets found with current criteria.")
@@ -370,20 +404,25 @@ def main():
         st.caption("Weak stats (xFPL90 < 4.0) + overperforming - unsustainable luck")
 
         if len(sell_candidates) > 0:
-            sell_display = sell_candidates.select(
-                [
-                    "name",
-                    "team",
-                    "position",
-                    "minutes",
-                    "total_points",
-                    "xFPL",
-                    "xFPL90",
-                    "delta",
-                ]
-            ).to_pandas()
+            sell_display = (
+                sell_candidates.select(
+                    [
+                        "name",
+                        "team",
+                        "position",
+                        "minutes",
+                        "total_points",
+                        "xFPL",
+                        "xFPL90",
+                        "delta",
+                    ]
+                )
+                .with_row_index("Rank", offset=1)
+                .to_pandas(use_pyarrow_extension_array=True)
+            )
 
             sell_display.columns = [
+                "Rank",
                 "Player",
                 "Team",
                 "Pos",
@@ -393,86 +432,143 @@ def main():
                 "xFPL90",
                 "Delta",
             ]
-            sell_display.insert(0, "Rank", range(1, len(sell_display) + 1))
 
             st.dataframe(
-                sell_display.style.background_gradient(
-                    subset=["Delta"], cmap="Greens", vmin=0
-                ).format(
-                    {
-                        "Mins": "{:.0f}",
-                        "Actual": "{:.0f}",
-                        "xFPL": "{:.1f}",
-                        "xFPL90": "{:.2f}",
-                        "Delta": "{:+.1f}",
-                    }
+                sell_display.style.apply(
+                    lambda _: delta_background_css(
+                        sell_candidates["delta"], "Greens", vmin=0
+                    ),
+                    subset=["Delta"],
                 ),
                 hide_index=True,
                 width="stretch",
                 height=400,
+                column_config={
+                    "Mins": st.column_config.NumberColumn(format="%.0f"),
+                    "Actual": st.column_config.NumberColumn(format="%.0f"),
+                    "xFPL": st.column_config.NumberColumn(format="%.1f"),
+                    "xFPL90": st.column_config.NumberColumn(format="%.2f"),
+                    "Delta": st.column_config.NumberColumn(format="%+.1f"),
+                },
             )
         else:
             st.info("No strong sell candidates found with current criteria.")
 
+
+def main():
+    st.title("⚽ FPL Over/Underperformance Analyzer")
+    st.markdown("""
+    Compare players' **Actual FPL Points** to their **Expected FPL Points (xFPL)**
+    to identify who's overperforming (lucky) vs. underperforming (unlucky).
+
+    **Split by playing time:** Regular starters (≥900 mins) vs Rotation/Bench players (<900 mins)
+    """)
+
+    # Strategy Guide - Always visible
+    render_strategy_expander()
+
     st.markdown("---")
 
-    # Refresh button
-    if st.button("🔄 Refresh Data"):
-        st.cache_data.clear()
-        st.rerun()
+    # Load data
+    with st.spinner("Loading FPL data..."):
+        try:
+            results_df = load_and_calculate_data()
+        except Exception as e:
+            st.error(f"Error loading data: {e}")
+            return
 
-    # Expandable methodology section
-    with st.expander("📊 How is xFPL Calculated?"):
-        st.markdown("""
-        **Expected FPL Points (xFPL)** uses an improved industry-standard algorithm:
+    # Summary statistics, computed in a single pass over delta
+    total_players, avg_delta, max_over, max_under = results_df.select(
+        pl.len(),
+        pl.col("delta").mean().alias("avg_delta"),
+        pl.col("delta").max().alias("max_over"),
+        pl.col("delta").min().alias("max_under"),
+    ).row(0)
 
-        ### Core Components
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Players", total_players)
+    with col2:
+        st.metric("Avg Over/Under", f"{avg_delta:+.2f}")
+    with col3:
+        st.metric("Max Overperformance", f"+{max_over:.1f}")
+    with col4:
+        st.metric("Max Underperformance", f"{max_under:.1f}")
 
-        1. **Expected Goals Points**: `xG × position_multiplier`
-           - Goalkeepers: **10 points** per goal
-           - Defenders: **6 points** per goal
-           - Midfielders: **5 points** per goal
-           - Forwards: **4 points** per goal
+    st.markdown("---")
 
-        2. **Expected Assists Points**: `xA × 3`
+    # Split data by minutes
+    regular_players = results_df.filter(pl.col("minutes") >= REGULAR_PLAYER_MINUTES)
+    rotation_players = results_df.filter(pl.col("minutes") < REGULAR_PLAYER_MINUTES)
 
-        3. **Expected Clean Sheet Points**
-           - **Per-match probability**: `e^(-xGC_per_match)` (not cumulative!)
-           - Matches played = minutes ÷ 90
-           - Expected clean sheets = CS probability × matches played
-           - Goalkeepers/Defenders: 4 points per clean sheet
-           - Midfielders: 1 point per clean sheet
-           - Forwards: 0 points
+    # Sort by delta once per direction (marking the column sorted so later ops
+    # can exploit it), then partition each pre-sorted view by minutes instead
+    # of running four separate filter+sort passes
+    over_sorted = (
+        results_df.sort("delta", descending=True)
+        .with_columns(pl.col("delta").set_sorted(descending=True))
+        .filter(pl.col("delta") >= 0)
+    )
+    under_sorted = (
+        results_df.sort("delta", descending=False)
+        .with_columns(pl.col("delta").set_sorted())
+        .filter(pl.col("delta") <= 0)
+    )
 
-        4. **Expected Bonus Points** ⭐
-           - **Estimated from BPS** (not actual bonus - no circular logic!)
-           - BPS per match = total BPS ÷ matches played
-           - Expected bonus ≈ (BPS per match ÷ 100) × 0.035 × matches
-           - ~3.5 bonus points per 100 BPS per match (empirical rate)
+    regular_over = over_sorted.filter(pl.col("minutes") >= REGULAR_PLAYER_MINUTES)
+    regular_under = under_sorted.filter(pl.col("minutes") >= REGULAR_PLAYER_MINUTES)
+    rotation_over = over_sorted.filter(pl.col("minutes") < REGULAR_PLAYER_MINUTES)
+    rotation_under = under_sorted.filter(pl.col("minutes") < REGULAR_PLAYER_MINUTES)
 
-        5. **Expected Appearance Points**:
-           - 2 points for playing ≥60 minutes (from starts)
-           - 1 point for playing <60 minutes (from substitute minutes)
+    # Tabs for different views
+    tab1, tab2 = st.tabs(
+        ["🏃 Regular Starters (≥900 mins)", "🪑 Rotation/Bench (<900 mins)"]
+    )
 
-        ### New Metrics ⭐
+    with tab1:
+        st.info(f"**{len(regular_players)} players** with ≥900 minutes played")
 
-        - **xFPL90** = (xFPL ÷ minutes) × 90 → Fair comparison regardless of playing time
-        - **xGI** = xG + xA → Total attacking threat
-        - **xGI90** = (xGI ÷ minutes) × 90 → Attacking threat per 90 minutes
+        display_performance_tables(
+            regular_over,
+            regular_under,
+            f"🔥 Overperformers (Delta ≥ 0) - {len(regular_over)} Players",
+            "Regular players scoring MORE than expected (potentially unsustainable)",
+            f"❄️ Underperformers (Delta ≤ 0) - {len(regular_under)} Players",
+            "Regular players scoring LESS than expected (due for correction)",
+        )
 
-        ### Performance Metrics
+    with tab2:
+        st.info(f"**{len(rotation_players)} players** with <900 minutes played")
 
-        **Delta** = Actual Points - xFPL
+        display_performance_tables(
+            rotation_over,
+            rotation_under,
+            f"🔥 Overperformers (Delta ≥ 0) - {len(rotation_over)} Players",
+            "Rotation players scoring MORE than expected (small sample size)",
+            f"❄️ Underperformers (Delta ≤ 0) - {len(rotation_under)} Players",
+            "Rotation players scoring LESS than expected (small sample size)",
+        )
 
-        - **Positive Delta**: Overperforming (could be skill or luck - check xFPL90!)
-        - **Negative Delta**: Underperforming (likely due for improvement)
+    st.markdown("---")
 
-        **Performance %** = (Actual ÷ xFPL) × 100
+    # Transfer Recommendations Section
+    st.header("💰 Transfer Recommendations")
+    st.markdown("""
+    Based on xFPL analysis, here are the **best buy targets** (underperformers with high xFPL)
+    and **sell candidates** (overperformers likely to regress).
+    """)
 
-        ### Data Source
+    render_recommendations(regular_players)
 
-        [Official FPL API](https://fantasy.premierleague.com/api/bootstrap-static/) - Updated live
-        """)
+    st.markdown("---")
+
+    # Refresh button
+    if st.button("🔄 Refresh Data"):
+        st.cache_data.clear()
+        st.rerun()
+
+    # Expandable methodology section
+    render_methodology_expander()
 
     # Footer
     st.markdown("---")
@@ -1,6 +1,7 @@
 # /// script
 # dependencies = [
-#   "httpx",
+#   "httpx[http2,brotli]",
+#   "msgspec",
 #   "polars",
 # ]
 # ///
@@ -11,10 +12,80 @@ FPL Data Fetcher Module
 Fetches player statistics from the Fantasy Premier League API.
 """
 
+from pathlib import Path
+
 import httpx
+import msgspec
 import polars as pl
 from typing import Dict, List, Optional
 
+# On-disk cache for the bootstrap-static payload so a conditional GET
+# (If-None-Match / If-Modified-Since) can skip the ~3 MB download entirely.
+CACHE_FILE = Path.home() / ".cache" / "fpl-performer" / "bootstrap.json"
+
+# element_type -> position short name
+POSITIONS = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
+
+# FPL stats fit comfortably in 32 bits or less (minutes <= ~3420, bps <= ~1000,
+# xG <= ~40); narrowing from the Int64/Float64 defaults halves column bandwidth
+# for every downstream pass
+PLAYER_SCHEMA_OVERRIDES = {
+    "element_type": pl.Int8,
+    "total_points": pl.Int32,
+    "minutes": pl.Int32,
+    "bps": pl.Int32,
+    "clean_sheets": pl.Int16,
+    "starts": pl.Int16,
+    "bonus": pl.Int16,
+}
+
+
+class Team(msgspec.Struct):
+    """The subset of an FPL team record needed for the name join."""
+
+    id: int
+    short_name: str
+
+
+class Player(msgspec.Struct):
+    """The subset of an FPL element record that feeds the player table."""
+
+    id: int
+    web_name: str
+    team: int
+    element_type: int
+    total_points: int
+    minutes: int
+    expected_goals: str
+    expected_assists: str
+    expected_goals_conceded: str
+    bps: int
+    clean_sheets: int
+    starts: int
+    bonus: int
+
+
+class Bootstrap(msgspec.Struct):
+    """Typed view of the bootstrap-static payload.
+
+    Decoding into structs skips the ~20,000 dict entries stdlib json would
+    allocate for fields this app never reads.
+    """
+
+    elements: List[Player]
+    teams: List[Team]
+
+
+_BOOTSTRAP_DECODER = msgspec.json.Decoder(Bootstrap)
+
+# Shared client: connection reuse skips the TCP+TLS handshake on revalidation
+# GETs, HTTP/2 multiplexes them, and brotli keeps the payload small on the wire
+_CLIENT = httpx.Client(
+    http2=True,
+    timeout=10.0,
+    headers={"accept-encoding": "gzip, br"},
+)
+
 
 class FPLDataFetcher:
     """Fetches and processes FPL player data from the official API."""
@@ -22,39 +93,68 @@ class FPLDataFetcher:
     BASE_URL = "https://fantasy.premierleague.com/api/bootstrap-static/"
 
     def __init__(self):
-        self.raw_data: Optional[Dict] = None
+        self.raw_data: Optional[Bootstrap] = None
         self.players_df: Optional[pl.DataFrame] = None
 
-    def fetch_data(self) -> Dict:
+    def _read_cache(self) -> Optional[Dict]:
+        """Load the cached payload and validators, or None if unusable."""
+        try:
+            return msgspec.json.decode(CACHE_FILE.read_bytes())
+        except (OSError, msgspec.DecodeError):
+            return None
+
+    def _write_cache(self, response: httpx.Response) -> None:
+        """Persist the fresh payload along with its cache validators."""
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CACHE_FILE.write_bytes(
+                msgspec.json.encode(
+                    {
+                        "etag": response.headers.get("etag"),
+                        "last_modified": response.headers.get("last-modified"),
+                        "payload": self.raw_data,
+                    }
+                )
+            )
+        except OSError:
+            # Cache is best-effort; a read-only filesystem shouldn't break fetching
+            pass
+
+    def fetch_data(self) -> Bootstrap:
         """
         Fetch raw data from FPL API.
 
+        Uses a conditional GET against an on-disk cache: if the API responds
+        304 Not Modified, the cached payload is returned without downloading
+        or re-parsing the full JSON body. Fresh payloads are decoded straight
+        into typed structs, skipping dict allocation for unused fields.
+
         Returns:
-            Dict containing all FPL data (players, teams, events, etc.)
+            Bootstrap struct with the player and team records
 
         Raises:
             httpx.HTTPError: If API request fails
         """
+        cached = self._read_cache()
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         try:
-            response = httpx.get(self.BASE_URL, timeout=10.0)
+            response = _CLIENT.get(self.BASE_URL, headers=headers)
+            if response.status_code == 304 and cached:
+                self.raw_data = msgspec.convert(cached["payload"], Bootstrap)
+                return self.raw_data
             response.raise_for_status()
-            self.raw_data = response.json()
+            self.raw_data = _BOOTSTRAP_DECODER.decode(response.content)
+            self._write_cache(response)
             return self.raw_data
         except httpx.HTTPError as e:
             raise Exception(f"Failed to fetch FPL data: {e}")
 
-    def _get_team_name(self, team_id: int, teams: List[Dict]) -> str:
-        """Get team short name from team ID."""
-        for team in teams:
-            if team["id"] == team_id:
-                return team["short_name"]
-        return "Unknown"
-
-    def _get_position_name(self, element_type: int) -> str:
-        """Convert element_type to position name."""
-        positions = {1: "GKP", 2: "DEF", 3: "MID", 4: "FWD"}
-        return positions.get(element_type, "Unknown")
-
     def process_players(self) -> pl.DataFrame:
         """
         Process raw FPL data into a structured DataFrame.
@@ -65,36 +165,46 @@ class FPLDataFetcher:
         if not self.raw_data:
             self.fetch_data()
 
-        elements = self.raw_data["elements"]
-        teams = self.raw_data["teams"]
+        elements = msgspec.to_builtins(self.raw_data.elements)
+        teams = msgspec.to_builtins(self.raw_data.teams)
 
-        # Extract relevant player data
-        players_data = []
-        for player in elements:
-            # Only include players with minutes played
-            if player["minutes"] > 0:
-                players_data.append(
-                    {
-                        "id": player["id"],
-                        "name": player["web_name"],
-                        "team": self._get_team_name(player["team"], teams),
-                        "position": self._get_position_name(player["element_type"]),
-                        "element_type": player["element_type"],
-                        "total_points": player["total_points"],
-                        "minutes": player["minutes"],
-                        "expected_goals": float(player["expected_goals"]),
-                        "expected_assists": float(player["expected_assists"]),
-                        "expected_goals_conceded": float(
-                            player["expected_goals_conceded"]
-                        ),
-                        "bps": player["bps"],
-                        "clean_sheets": player["clean_sheets"],
-                        "starts": player["starts"],
-                        "bonus": player["bonus"],
-                    }
-                )
+        # Team lookup table for a vectorized id -> short_name join
+        teams_df = pl.DataFrame(teams).select(
+            pl.col("id").alias("team"), pl.col("short_name").alias("team_name")
+        )
 
-        self.players_df = pl.DataFrame(players_data)
+        # Build the full table in one columnar pass, then derive columns vectorized
+        self.players_df = (
+            pl.DataFrame(elements, schema_overrides=PLAYER_SCHEMA_OVERRIDES)
+            # Only include players with minutes played
+            .filter(pl.col("minutes") > 0)
+            .join(teams_df, on="team", how="left")
+            .with_columns(
+                pl.col("web_name").alias("name"),
+                pl.col("element_type")
+                .replace_strict(POSITIONS, default="Unknown")
+                .alias("position"),
+                pl.col("expected_goals").cast(pl.Float32),
+                pl.col("expected_assists").cast(pl.Float32),
+                pl.col("expected_goals_conceded").cast(pl.Float32),
+            )
+            .select(
+                "id",
+                "name",
+                pl.col("team_name").fill_null("Unknown").alias("team"),
+                "position",
+                "element_type",
+                "total_points",
+                "minutes",
+                "expected_goals",
+                "expected_assists",
+                "expected_goals_conceded",
+                "bps",
+                "clean_sheets",
+                "starts",
+                "bonus",
+            )
+        )
         return self.players_df
 
     def get_players_dataframe(self) -> pl.DataFrame:
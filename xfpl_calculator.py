@@ -12,6 +12,7 @@ Uses industry best practices for clean sheet probability and bonus estimation.
 """
 
 import polars as pl
+from typing import Optional
 
 
 class XFPLCalculator:
@@ -27,6 +28,18 @@ class XFPLCalculator:
     # Bonus points estimation constants (empirical from FPL data)
     BONUS_PER_100_BPS_PER_MATCH = 0.035  # ~3.5 bonus points per 100 BPS per match
 
+    # Per-position multipliers as a join table, built once at class load.
+    # A single left join replaces the per-row when/then branching over
+    # element_type for both goal and clean sheet points.
+    POSITION_POINTS = pl.DataFrame(
+        {
+            "element_type": list(GOALS_POINTS),
+            "goal_mul": list(GOALS_POINTS.values()),
+            "cs_mul": list(CLEAN_SHEET_POINTS.values()),
+        },
+        schema={"element_type": pl.Int8, "goal_mul": pl.Int8, "cs_mul": pl.Int8},
+    )
+
     def __init__(self, players_df: pl.DataFrame):
         """
         Initialize calculator with player data.
@@ -34,147 +47,99 @@ class XFPLCalculator:
         Args:
             players_df: Polars DataFrame with player statistics
         """
-        self.players_df = players_df.clone()
+        # LazyFrames are immutable, so no defensive clone is needed
+        self._lf = players_df.lazy()
+        self._result: Optional[pl.DataFrame] = None
 
     def calculate_xfpl(self) -> pl.DataFrame:
         """
         Calculate xFPL for all players using improved algorithm.
 
+        The result is computed once and memoized; repeated calls (e.g. from
+        get_overperformers/get_underperformers) return the cached DataFrame.
+
         Returns:
             DataFrame with xFPL calculations and performance metrics
         """
-        df = self.players_df.clone()
-
-        # Calculate matches played (estimate)
-        df = df.with_columns([(pl.col("minutes") / 90).alias("matches_played")])
-
-        # Calculate expected goals points
-        df = df.with_columns(
-            [
-                pl.when(pl.col("element_type") == 1)
-                .then(pl.col("expected_goals") * 10)
-                .when(pl.col("element_type") == 2)
-                .then(pl.col("expected_goals") * 6)
-                .when(pl.col("element_type") == 3)
-                .then(pl.col("expected_goals") * 5)
-                .when(pl.col("element_type") == 4)
-                .then(pl.col("expected_goals") * 4)
-                .otherwise(0.0)
-                .alias("xG_points")
-            ]
+        if self._result is not None:
+            return self._result
+        # All derived columns are defined as expression trees and evaluated in
+        # a single with_columns pass, letting the Polars optimizer share common
+        # subexpressions (matches_played, xGI) instead of materializing seven
+        # intermediate DataFrames.
+
+        # Matches played (estimate)
+        matches_played = pl.col("minutes") / 90
+
+        # Safe denominators: zero-minute rows would otherwise poison every
+        # ratio below with NaN/Inf and force cleanup passes afterwards
+        safe_matches = (
+            pl.when(matches_played > 0).then(matches_played).otherwise(1.0)
         )
-
-        # Calculate expected assists points
-        df = df.with_columns(
-            [(pl.col("expected_assists") * self.ASSISTS_POINTS).alias("xA_points")]
+        safe_minutes = pl.when(pl.col("minutes") > 0).then(pl.col("minutes")).otherwise(1)
+
+        # Expected goals points (position multiplier from the join table)
+        xg_points = pl.col("expected_goals") * pl.col("goal_mul").fill_null(0)
+
+        # Expected assists points
+        xa_points = pl.col("expected_assists") * self.ASSISTS_POINTS
+
+        # IMPROVED: Expected clean sheet points using per-match probability
+        # P(CS per match) = e^(-xGC_per_match); expected total = P(CS) * matches
+        xgc_per_match = pl.col("expected_goals_conceded") / safe_matches
+        expected_cs = (-xgc_per_match).exp() * matches_played
+        xcs_points = expected_cs * pl.col("cs_mul").fill_null(0)
+
+        # IMPROVED: Expected bonus estimated from BPS (not actual bonus).
+        # (bps / matches / 100) * rate * matches simplifies to bps * rate / 100;
+        # the constant factor folds at Python level, leaving one vector multiply
+        xbonus_points = pl.col("bps") * (self.BONUS_PER_100_BPS_PER_MATCH / 100.0)
+
+        # Expected appearance points. Substitute minutes are clamped while
+        # still an integer column, so the clip runs on cheap int lanes and the
+        # divide sees an already-valid numerator instead of clipping floats
+        sub_minutes = (pl.col("minutes") - pl.col("starts") * 60).clip(lower_bound=0)
+        xappearance_points = (
+            pl.col("starts") * self.APPEARANCE_60_MIN
+            + sub_minutes / 30 * self.APPEARANCE_1_MIN
         )
 
-        # IMPROVED: Calculate expected clean sheet points using per-match probability
-        # Average xGC per match
-        xgc_per_match = pl.col("expected_goals_conceded") / pl.col("matches_played")
-        # Clean sheet probability per match: P(CS) = e^(-xGC_per_match)
-        cs_prob_per_match = (-xgc_per_match).exp()
-        # Expected total clean sheets = CS probability * matches played
-        expected_cs = cs_prob_per_match * pl.col("matches_played")
-
-        df = df.with_columns(
-            [
-                pl.when(pl.col("element_type") == 1)
-                .then(expected_cs * 4)
-                .when(pl.col("element_type") == 2)
-                .then(expected_cs * 4)
-                .when(pl.col("element_type") == 3)
-                .then(expected_cs * 1)
-                .when(pl.col("element_type") == 4)
-                .then(0.0)
+        # Total xFPL
+        xfpl = xg_points + xa_points + xcs_points + xbonus_points + xappearance_points
+
+        # Per-90 metrics for fair comparison
+        xgi = pl.col("expected_goals") + pl.col("expected_assists")
+
+        self._result = (
+            self._lf.join(self.POSITION_POINTS.lazy(), on="element_type", how="left")
+            .with_columns(
+                matches_played.round(1).alias("matches_played"),
+                xg_points.alias("xG_points"),
+                xa_points.alias("xA_points"),
+                xcs_points.alias("xCS_points"),
+                xbonus_points.alias("xBonus_points"),
+                xappearance_points.alias("xAppearance_points"),
+                xfpl.round(2).alias("xFPL"),
+                ((pl.col("expected_goals") / safe_minutes) * 90)
+                .round(3)
+                .alias("xG90"),
+                ((pl.col("expected_assists") / safe_minutes) * 90)
+                .round(3)
+                .alias("xA90"),
+                ((xfpl / safe_minutes) * 90).round(2).alias("xFPL90"),
+                xgi.round(3).alias("xGI"),
+                ((xgi / safe_minutes) * 90).round(3).alias("xGI90"),
+                (pl.col("total_points") - xfpl).round(2).alias("delta"),
+                pl.when(xfpl > 0)
+                .then((pl.col("total_points") / xfpl) * 100)
                 .otherwise(0.0)
-                .alias("xCS_points")
-            ]
-        )
-
-        # IMPROVED: Estimate expected bonus from BPS (not actual bonus)
-        # Average BPS per match
-        bps_per_match = pl.col("bps") / pl.col("matches_played")
-        # Expected bonus = (BPS per match / 100) * bonus_rate * matches_played
-        expected_bonus = (
-            (bps_per_match / 100)
-            * self.BONUS_PER_100_BPS_PER_MATCH
-            * pl.col("matches_played")
-        )
-
-        df = df.with_columns([expected_bonus.alias("xBonus_points")])
-
-        # Calculate expected appearance points
-        df = df.with_columns(
-            [
-                (
-                    (pl.col("starts") * self.APPEARANCE_60_MIN)
-                    + (
-                        (pl.col("minutes") - pl.col("starts") * 60)
-                        / 30
-                        * self.APPEARANCE_1_MIN
-                    ).clip(0, None)
-                ).alias("xAppearance_points")
-            ]
-        )
-
-        # Calculate total xFPL
-        df = df.with_columns(
-            [
-                (
-                    pl.col("xG_points")
-                    + pl.col("xA_points")
-                    + pl.col("xCS_points")
-                    + pl.col("xBonus_points")
-                    + pl.col("xAppearance_points")
-                ).alias("xFPL")
-            ]
-        )
-
-        # NEW: Add per-90 metrics for fair comparison
-        df = df.with_columns(
-            [
-                ((pl.col("expected_goals") / pl.col("minutes")) * 90).alias("xG90"),
-                ((pl.col("expected_assists") / pl.col("minutes")) * 90).alias("xA90"),
-                ((pl.col("xFPL") / pl.col("minutes")) * 90).alias("xFPL90"),
-                (pl.col("expected_goals") + pl.col("expected_assists")).alias("xGI"),
-                (
-                    (
-                        (pl.col("expected_goals") + pl.col("expected_assists"))
-                        / pl.col("minutes")
-                    )
-                    * 90
-                ).alias("xGI90"),
-            ]
-        )
-
-        # Calculate performance metrics
-        df = df.with_columns(
-            [
-                (pl.col("total_points") - pl.col("xFPL")).alias("delta"),
-                ((pl.col("total_points") / pl.col("xFPL")) * 100)
-                .fill_nan(0.0)
-                .fill_null(0.0)
+                .round(1)
                 .alias("performance_pct"),
-            ]
+            )
+            .drop(["goal_mul", "cs_mul"])
+            .collect()
         )
-
-        # Round for readability
-        df = df.with_columns(
-            [
-                pl.col("xFPL").round(2),
-                pl.col("xG90").round(3),
-                pl.col("xA90").round(3),
-                pl.col("xGI").round(3),
-                pl.col("xGI90").round(3),
-                pl.col("xFPL90").round(2),
-                pl.col("delta").round(2),
-                pl.col("performance_pct").round(1),
-                pl.col("matches_played").round(1),
-            ]
-        )
-
-        return df
+        return self._result
 
     def get_overperformers(self, n: int = 10) -> pl.DataFrame:
         """
@@ -186,8 +151,13 @@ class XFPLCalculator:
         Returns:
             DataFrame with top overperformers
         """
-        df = self.calculate_xfpl()
-        return df.sort("delta", descending=True).head(n)
+        return (
+            self.calculate_xfpl()
+            .lazy()
+            .sort("delta", descending=True)
+            .head(n)
+            .collect()
+        )
 
     def get_underperformers(self, n: int = 10) -> pl.DataFrame:
         """
@@ -199,8 +169,13 @@ class XFPLCalculator:
         Returns:
             DataFrame with top underperformers
         """
-        df = self.calculate_xfpl()
-        return df.sort("delta", descending=False).head(n)
+        return (
+            self.calculate_xfpl()
+            .lazy()
+            .sort("delta", descending=False)
+            .head(n)
+            .collect()
+        )
 
 
 def calculate_xfpl(players_df: pl.DataFrame) -> pl.DataFrame: